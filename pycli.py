@@ -33,13 +33,37 @@ import time
 import sys
 import shlex
 import functools
+import atexit
 import typing
+import types
 from pympler import asizeof
 
 colorama.init()
+__logs = {"date": None, "file": None}
+
+class _Command:
+    "Data of a command registered in the CLI."
+    __slots__ = ("function", "doc", "args", "options", "params", "alias", "info", "la", "lap")
+
+    def __init__(self, function: callable, doc: str, args: list, options: list, params: dict, alias: list) -> None:
+        self.function = function
+        self.doc = doc
+        self.args = args
+        self.options = options
+        self.params = params
+        self.alias = alias
+        self.info = ""
+        self.la = ""
+        self.lap = ""
+
 
 class CLI:
     home = os.path.dirname(__file__)
+    __convert = {
+        bytes: str.encode,
+        bytearray: lambda value: bytearray(value, "utf-8"),
+    }
+
     def __init__(self,
                  prompt: str = "[{}]@[{}]\\>",
                  user: str = "Python-Cli",
@@ -71,10 +95,14 @@ class CLI:
             >>>     print("Hello World")
             >>> cli.run()
         """
+        windows = os.name == 'nt'
         if title is not None:
-            os.system("title {}".format(title) if os.name == 'nt' else "echo -n '\033]0;{}\007'".format(title))
+            os.system("title {}".format(title) if windows else "echo -n '\033]0;{}\007'".format(title))
 
         self.__cmd = {}
+        self.__alias = {}
+        self.__builtin = set()
+        self.__sorted = None
         self.prompt = prompt
         self.user = user
         self.path = CLI.home
@@ -82,7 +110,7 @@ class CLI:
         self.anim = anim
         self.cool = cool
         self.color = color
-        self.__clear_cmd = "cls" if os.name == 'nt' else "clear"
+        self.__clear_cmd = "cls" if windows else "clear"
         self.command(alias=["?"], doc=self.help.__doc__)(self.help)
         self.command(alias=[self.__clear_cmd], name="clear-host", doc=self.clear_host.__doc__)(self.clear_host)
         self.command(alias=["exit"], doc=self.leave.__doc__)(self.leave)
@@ -91,6 +119,7 @@ class CLI:
         @optional(CLI.home)
         def change_directory(path) -> None:
             self.change_directory(path)
+        self.__builtin.update(self.__cmd)
 
     def command(self,
                 name: str = None,
@@ -119,71 +148,70 @@ class CLI:
             def wrapper(name: str, doc: str, alias: list) -> None:
                 if doc is None:
                     doc = ""
-                data = {"function": func}
                 args_info = inspect.signature(func).parameters.items()
                 args, options, params = [], [], {}
                 for arg_name, arg_info in args_info:
-                    if arg_info.default == inspect.Signature.empty:
-                        args.append(("[{}]".format(arg_name), arg_info.annotation))
+                    if arg_info.default is inspect.Signature.empty:
+                        args.append(("[{}]".format(arg_name), arg_info.annotation, arg_name, self.__converters(arg_info.annotation)))
                     elif arg_info.default is True:
                         options.append("-{}".format(arg_name))
                     else:
-                        params["--{}".format(arg_name)] = (arg_info.annotation, arg_info.default)
-                if doc != "":
-                    data["doc"] = doc
-                if args != []:
-                    data["args"] = args
-                if options != []:
-                    data["options"] = options
-                if params != {}:
-                    data["params"] = params
-                if alias != []:
-                    data["alias"] = [i.lower() for i in alias]
+                        params["--{}".format(arg_name)] = (arg_info.annotation, arg_info.default, self.__converters(arg_info.annotation))
                 name = name.replace(" ", "_").lower()
-                data["info"] = self.__info(name, data)
-                self.__cmd[name] = data
-                self.__cmd.update({i.lower(): name for i in alias})
+                alias = [i for i in dict.fromkeys(i.lower() for i in alias) if i != name]
+                for i in alias:
+                    owner = self.__alias.get(i)
+                    if owner is not None and owner != name and owner not in self.__builtin:
+                        raise ValueError("The alias {} is already used by {}.".format(i, owner))
+                for i in [name] + alias:
+                    self.__release(i)
+                self.__builtin.discard(name)
+                cmd = _Command(func, doc, args, options, params, alias)
+                self.__describe(name, cmd)
+                self.__cmd[name] = cmd
+                self.__alias.update({i: name for i in alias})
+                self.__sorted = None
             return wrapper(name=name if name else func.__name__, doc=doc if doc else func.__doc__, alias=alias)
         return decorator
 
     def leave(self) -> None:
         "Close the terminal."
-        os.kill(os.getpid(), 9)
+        sys.exit(0)
 
     def clear_host(self) -> None:
         "Reset the display of the terminal."
         os.system(self.__clear_cmd)
 
-    def __format(self, name: str, cmd: dict) -> dict:
-        "Format data of command."
-        data = {}
-        for i in [("alias", []), ("doc", ""), ("args", []), ["params", {}], ["options", []]]:
-            data[i[0]] = cmd.get(i[0], i[1])
-        local = ", ".join(data["alias"])
-        data["la"] = local, len(local)
-        local = name
-        for i in [' '.join(arg[0] for arg in data["args"]), ' '.join(data["params"].keys()), ' '.join(data["options"])]:
-            if len(i) != 0:
-                local += " " + i
-        data["lap"] = local, len(local)
-        return data
+    def __release(self, word: str) -> None:
+        "Free a name or alias so that a new command can take it."
+        owner = self.__alias.pop(word, None)
+        if owner is not None:
+            cmd = self.__cmd[owner]
+            cmd.alias.remove(word)
+            self.__describe(owner, cmd)
+        elif word in self.__cmd:
+            for i in self.__cmd.pop(word).alias:
+                del self.__alias[i]
+            self.__builtin.discard(word)
+
+    def __describe(self, name: str, cmd: _Command) -> None:
+        "Build the info message and the help columns of a command."
+        cmd.info = self.__info(name, cmd)
+        cmd.la = ", ".join(cmd.alias)
+        cmd.lap = " ".join([name] + [arg[0] for arg in cmd.args] + list(cmd.params) + cmd.options)
 
     def help(self, m: bool = True) -> None:
         "Displays info about terminal commands."
-        cmds = {}
-        lap = la = 0
-        for name, cmd in self.__cmd.items():
-            if isinstance(cmd, dict):
-                cmds[name] = self.__format(name, cmd)
-                la = max(la, cmds[name]["la"][1])
-                lap = max(lap, cmds[name]["lap"][1])
+        if self.__sorted is None:
+            self.__sorted = sorted(self.__cmd)
+        cmds = [(name, self.__cmd[name]) for name in self.__sorted]
         if m:
-            lines = ["Alias  {} -> {} {}".format(cmds[cmd]['la'][0]+(la-cmds[cmd]['la'][1])*' ', cmds[cmd]['lap'][0]+(lap-cmds[cmd]['lap'][1])*' ',cmds[cmd]['doc']) for cmd in sorted(cmds)]
+            la = max(len(cmd.la) for name, cmd in cmds)
+            lap = max(len(cmd.lap) for name, cmd in cmds)
+            lines = ["Alias  {} -> {} {}".format(cmd.la.ljust(la), cmd.lap.ljust(lap), cmd.doc) for name, cmd in cmds]
         else:
-            lines = ["{} - {}".format(cmd, cmds[cmd]['doc']) for cmd in sorted(cmds)]
-        max_length = max(len(line.split(" - ")[0]) for line in lines) if not m else 0
-        if not m:
-            lines = ["{} {}".format(cmd.ljust(max_length), cmds[cmd]['doc']) for cmd in sorted(cmds)]
+            max_length = max(len(name) for name, cmd in cmds)
+            lines = ["{} {}".format(name.ljust(max_length), cmd.doc) for name, cmd in cmds]
         text = "\n".join(lines)
         echo(text, anim=self.anim, cool=self.cool, color=self.color)
 
@@ -199,81 +227,108 @@ class CLI:
         else:
             echo("The path is invalid.", anim=self.anim, cool=self.cool, color=self.color)
 
-    def __decode(self, tpe: object, value: any) -> object:
-        "Format arguments in the types chosen when creating commands."
+    @staticmethod
+    def __to_bool(value: str) -> bool:
+        "Decode a boolean entered in the terminal."
+        value = value.lower()
+        if value in ("1", "true", "yes", "y", "on"):
+            return True
+        if value in ("0", "false", "no", "n", "off"):
+            return False
+        raise ValueError("Invalid boolean: {}".format(value))
+
+    def __converter(self, tpe: object) -> typing.Callable:
+        "Resolve the callable that decodes a value of the given type."
+        if tpe is bool:
+            return self.__to_bool
+        return self.__convert.get(tpe, tpe)
+
+    def __converters(self, tpe: object) -> tuple:
+        "Resolve the converters used to decode an argument of the given annotation, tried in order."
         if tpe is inspect.Signature.empty:
+            return ()
+        if getattr(tpe, "__origin__", None) is typing.Union or isinstance(tpe, getattr(types, "UnionType", ())):
+            members = [member for member in tpe.__args__ if member is not type(None)]
+        else:
+            members = [tpe]
+        return tuple(self.__converter(member) for member in members if callable(member))
+
+    def __decode(self, converters: tuple, value: str) -> object:
+        "Format arguments in the types chosen when creating commands."
+        if not converters:
             return value
-        elif hasattr(tpe, '__args__'):
-            for member in tpe.__args__:
-                return member(value)
-        return tpe(value)
+        for converter in converters:
+            try:
+                return converter(value)
+            except (ValueError, TypeError):
+                continue
+        raise ValueError("Invalid value: {}".format(value))
 
-    def __info(self, name: str, data: dict) -> str:
+    def __info(self, name: str, cmd: _Command) -> str:
         "Creates the information message for the commands to add in the cli."
-        usage = "\nUsage: {}".format(name)
-        txt = ""
-        for i in data:
-            if i == "doc":
-                txt += "\nDocumentation: {}".format(data[i])
-            elif i == "args":
-                txt += "\nArgument(s):"
-                for j in data["args"]:
-                    usage += " {}".format(j[0])
-                    txt += "\n    {}: {}".format(j[0].replace("[", "").replace("]", ""), str(j[1]).replace("<class '", "").replace("'>", ""))
-            elif i == "params":
-                txt += "\nParameter(s):"
-                for j in data["params"]:
-                    usage += " {}".format(j)
-                    tpe = str(data['params'][j][0]).replace("<class '", "").replace("'>", "")
-                    if tpe == "None":
-                        tpe = ""
-                    else:
-                        tpe = ": " + tpe
-                    txt += "\n    {}{} = {}".format(j, tpe, data['params'][j][1])
-            elif i == "options":
-                txt += "\nOption(s):"
-                for j in data["options"]:
-                    usage += " {}".format(j)
-                txt += " {}".format(j)
-            elif i == "alias":
-                txt += "\nAlias: "
-                txt += ", ".join(data["alias"])
-        return txt[1:] + usage
-
-    def exec(self, cmd: dict, entry: str) -> None:
+        usage = [name]
+        lines = []
+        if cmd.doc:
+            lines.append("Documentation: {}".format(cmd.doc))
+        if cmd.args:
+            lines.append("Argument(s):")
+            for j in cmd.args:
+                usage.append(j[0])
+                lines.append("    {}: {}".format(j[2], str(j[1]).replace("<class '", "").replace("'>", "")))
+        if cmd.options:
+            usage.extend(cmd.options)
+            lines.append("Option(s): {}".format(" ".join(cmd.options)))
+        if cmd.params:
+            lines.append("Parameter(s):")
+            for j in cmd.params:
+                usage.append(j)
+                tpe = str(cmd.params[j][0]).replace("<class '", "").replace("'>", "")
+                if tpe == "None":
+                    tpe = ""
+                else:
+                    tpe = ": " + tpe
+                lines.append("    {}{} = {}".format(j, tpe, cmd.params[j][1]))
+        if cmd.alias:
+            lines.append("Alias: {}".format(", ".join(cmd.alias)))
+        lines.append("Usage: {}".format(" ".join(usage)))
+        return "\n".join(lines)
+
+    def exec(self, cmd: _Command, entry: list) -> None:
         "Runs commands entered by the user."
-        kwargs = {}
-        if cmd.get("options"):
-            for opt in cmd.get("options"):
-                kwargs[opt[1:]] = False
+        kwargs = {opt[1:]: False for opt in cmd.options}
+        args = cmd.args
+        params = cmd.params
+        size = len(entry)
         index = 1
         arg_i = 0
         do = False
-        while index < len(entry):
+        while index < size:
             arg = entry[index]
             if arg.startswith("--"):
-                value = cmd["params"].get(arg)
+                value = params.get(arg)
                 if value is None:
                     echo("Unknown Parameter", anim=self.anim, cool=self.cool, logs=self.logs, color=self.color)
                     do = True
                     break
-                kwargs[arg[2:]] = None if index + 1 >= len(entry) else self.__decode(value[0], entry[index + 1])
-                index += 1 if kwargs[arg[2:]] is not None else 0
+                key = arg[2:]
+                kwargs[key] = None if index + 1 >= size else self.__decode(value[2], entry[index + 1])
+                index += 1 if kwargs[key] is not None else 0
             elif arg.startswith("-"):
-                if arg[1:] in kwargs:
-                    kwargs[arg[1:]] = True
+                key = arg[1:]
+                if key in kwargs:
+                    kwargs[key] = True
                 else:
                     if arg == "-?":
                         do = True
-                        echo(cmd["info"], anim=self.anim, cool=self.cool, logs=self.logs, color=self.color)
+                        echo(cmd.info, anim=self.anim, cool=self.cool, logs=self.logs, color=self.color)
                         break
                     else:
                         echo("Unknown Option", anim=self.anim, cool=self.cool, logs=self.logs, color=self.color)
                         do = True
                         break
             else:
-                if arg_i < len(cmd["args"]):
-                    kwargs[cmd["args"][arg_i][0].strip("[]")] = self.__decode(cmd["args"][arg_i][1], arg)
+                if arg_i < len(args):
+                    kwargs[args[arg_i][2]] = self.__decode(args[arg_i][3], arg)
                     arg_i += 1
                 else:
                     echo("Too many arguments provided.", anim=self.anim, cool=self.cool, logs=self.logs, color=self.color)
@@ -281,26 +336,31 @@ class CLI:
                     break
             index += 1
         if not do:
-            cmd["function"](**kwargs)
+            cmd.function(**kwargs)
 
     def run(self) -> None:
         "This method of the CLI object allows you to launch the CLI after you have created all your commands."
         if self.logs:
-            write_logs(self.__cmd)
+            if self.__sorted is None:
+                self.__sorted = sorted(self.__cmd)
+            write_logs("CLI started with commands:", ", ".join(self.__sorted))
         while True:
             try:
-                entry = shlex.split(prompt(self.prompt.format(self.user, self.path), anim=self.anim, cool=self.cool, color=self.color, logs=self.logs))
+                line = prompt(self.prompt.format(self.user, self.path), anim=self.anim, cool=self.cool, color=self.color, logs=self.logs)
+                try:
+                    entry = shlex.split(line)
+                except ValueError:
+                    entry = line.split()
                 if not entry:
                     continue
-                cmd = self.__cmd.get(entry[0].lower())
+                head = entry[0].lower()
+                cmd = self.__cmd.get(head) or self.__cmd.get(self.__alias.get(head))
                 if cmd is None:
                     echo("{} doesn't exist.\nDo help to get the list of existing commands.".format(entry[0]), anim=self.anim, cool=self.cool, logs=self.logs, color=self.color)
                     continue
-                if isinstance(cmd, str):
-                    cmd = self.__cmd[cmd]
                 self.exec(cmd, entry)
-            except KeyboardInterrupt:
-                os.kill(os.getpid(), 9)
+            except (KeyboardInterrupt, EOFError):
+                sys.exit(0)
             except Exception as e:
                 echo("An unexpected error occurred: {}".format(e), anim=self.anim, cool=self.cool, logs=self.logs, color=self.color)
 
@@ -336,13 +396,12 @@ def echo(*values: object,
         >>> pycli.echo("Hello World", anim=True, cool=15, logs=True)
     """
     output = sep.join(map(str, values))
-    if len(output) != 0:
-        times =  cool / len(output)
+    stream = sys.stdout if file is None else file
     if anim:
-        for char in output:
-            print(colored(char, color), end="", flush=True, file=file)
-            time.sleep(times)
-        print(end=end)
+        __animate(stream, output, cool, color)
+        stream.write(end)
+        if flush:
+            stream.flush()
     else:
         print(colored(output, color), end=end, flush=flush, file=file)
     if logs:
@@ -368,14 +427,12 @@ def prompt(__prompt: object = "",
         >>> import pycli
         >>> pycli.prompt("What's your name ?", anim=True, cool=15, logs=True, end="\n", sep=" ")
     """
-    if len(__prompt) != 0:
-        times =  cool / len(__prompt)
+    text = str(__prompt)
+    stream = sys.stdout
     if anim:
-        for i in str(__prompt):
-            print(colored(i, color), end="", flush=flush)
-            time.sleep(times)
+        __animate(stream, text, cool, color)
     else:
-        print(colored(str(__prompt), color), end="", flush=flush)
+        print(colored(text, color), end="", flush=flush)
     returned = input()
     if logs:
         write_logs(returned)
@@ -396,10 +453,45 @@ def write_logs(*values: object,
         >>> pycli.write_logs("CLI was starting.")
     """
     text = sep.join(map(str, values)) + end
-    if not os.path.exists("latest"):
-        os.mkdir("latest")
-    with open(os.path.join("latest", "{}.log".format(datetime.datetime.today().date())), "a", encoding="UTF-8") as file:
-        file.write("{} {}".format(datetime.datetime.now().strftime('%H:%M:%S'), text))
+    now = datetime.datetime.now()
+    date = now.date()
+    if __logs["date"] != date:
+        __close_logs()
+        os.makedirs("latest", exist_ok=True)
+        __logs["file"] = open(os.path.join("latest", "{}.log".format(date)), "a", encoding="UTF-8", buffering=1)
+        __logs["date"] = date
+    __logs["file"].write("{:02d}:{:02d}:{:02d} {}".format(now.hour, now.minute, now.second, text))
+
+
+def __close_logs() -> None:
+    "Close the daily log file kept open by write_logs."
+    if __logs["file"] is not None:
+        __logs["file"].close()
+        __logs["file"] = None
+        __logs["date"] = None
+
+
+atexit.register(__close_logs)
+
+
+def __animate(stream: object,
+              text: str,
+              cool: float,
+              color: typing.Union[tuple, str] = None
+              ) -> None:
+    "Write the text progressively, spreading the cool delay over its characters."
+    write, flush, sleep = stream.write, stream.flush, time.sleep
+    if color:
+        write(__ansi(color))
+    if len(text) != 0:
+        times = cool / len(text)
+        for char in text:
+            write(char)
+            flush()
+            sleep(times)
+    if color:
+        write("\033[0m")
+    flush()
 
 
 def __to_rgb(color: typing.Union[tuple, str] = None) -> tuple:
@@ -409,6 +501,11 @@ def __to_rgb(color: typing.Union[tuple, str] = None) -> tuple:
     return tuple(int(v) for v in color)
 
 
+def __ansi(color: typing.Union[tuple, str]) -> str:
+    "Build the ANSI escape sequence that switches the foreground to the given color."
+    return "\033[38;2;{};{};{}m".format(*__to_rgb(color))
+
+
 def colored(text: str,
             color: typing.Union[tuple, str, list] = None
             ) -> str:
@@ -427,8 +524,7 @@ def colored(text: str,
         >>> print(pycli.colored("Hello World", (255, 0, 0)))
     """
     if color:
-        color = __to_rgb(color)
-        return "\033[38;2;{};{};{}m{}\033[0m".format(int(color[0]), int(color[1]), int(color[2]), text)
+        return "{}{}\033[0m".format(__ansi(color), text)
     return text
 
 
@@ -543,9 +639,10 @@ def optional(*defaults):
         >>>     print("Hello", name)
     """
     def decorator(func: callable) -> typing.Callable:
+        names = tuple(inspect.signature(func).parameters)
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> any:
-            for i, (param_name, param) in enumerate(inspect.signature(func).parameters.items()):
+            for i, param_name in enumerate(names):
                 if param_name not in kwargs or kwargs[param_name] is inspect.Signature.empty:
                     if i < len(defaults):
                         kwargs[param_name] = defaults[i]